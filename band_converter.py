@@ -7,83 +7,126 @@ User: ertig3
 """
 
 import logging
+from bisect import bisect_right
+from functools import lru_cache
+
+# Deletes every ASCII character except digits and the decimal point
+_NON_NUMERIC_ASCII = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if not (chr(i).isdigit() or chr(i) == '.')
+))
+
+def _normalize_frequency_hz(freq_text):
+    """Normalize frequency text (Hz, kHz or MHz) to Hz"""
+    try:
+        freq_clean = freq_text.translate(_NON_NUMERIC_ASCII)
+        if not freq_clean.isascii():
+            # Rare non-ASCII input: keep the exact per-character filtering
+            freq_clean = ''.join(c for c in freq_clean if c.isdigit() or c == '.')
+        
+        if not freq_clean:
+            return None
+        
+        freq_num = float(freq_clean)
+        
+        if freq_num < 1000:
+            return int(freq_num * 1000000)
+        elif freq_num < 1000000:
+            return int(freq_num * 1000)
+        elif freq_num < 1000000000:
+            return int(freq_num)
+        else:
+            return int(freq_num)
+            
+    except (ValueError, TypeError):
+        return None
+
+# (freq_min_hz, freq_max_hz, band) sorted by lower bound; ranges don't overlap
+_BANDS = (
+    (135700, 137800, "2200M"),
+    (472000, 479000, "630M"),
+    (1800000, 2000000, "160M"),
+    (3500000, 4000000, "80M"),
+    (5330500, 5406500, "60M"),
+    (7000000, 7300000, "40M"),
+    (10100000, 10150000, "30M"),
+    (14000000, 14350000, "20M"),
+    (18068000, 18168000, "17M"),
+    (21000000, 21450000, "15M"),
+    (24890000, 24990000, "12M"),
+    (28000000, 29700000, "10M"),
+    (50000000, 54000000, "6M"),
+    (70000000, 70500000, "4M"),
+    (144000000, 148000000, "2M"),
+    (222000000, 225000000, "1.25M"),
+    (430000000, 440000000, "70CM"),
+    (902000000, 928000000, "33CM"),
+    (1240000000, 1300000000, "23CM"),
+    (2300000000, 2450000000, "13CM"),
+    (3300000000, 3500000000, "9CM"),
+    (5650000000, 5925000000, "6CM"),
+    (10000000000, 10500000000, "3CM"),
+)
+# Parallel columns of _BANDS for bisect lookups
+_LOWERS = tuple(freq_min for freq_min, _, _ in _BANDS)
+_UPPERS = tuple(freq_max for _, freq_max, _ in _BANDS)
+_NAMES = tuple(band for _, _, band in _BANDS)
+
+# Distinct raw frequency values remembered by frequency_to_band
+BAND_CACHE_SIZE = 2048
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=BAND_CACHE_SIZE)
+def frequency_to_band(frequency_str):
+    """Convert frequency to band (cached per raw frequency value)"""
+    try:
+        freq_hz = normalize_frequency(frequency_str)
+        
+        if freq_hz is None:
+            logger.warning("Invalid frequency: %s", frequency_str)
+            return "UNKNOWN"
+        
+        return frequency_to_band_hz(freq_hz)
+        
+    except Exception as e:
+        logger.error("Band conversion error: %s", e)
+        return "UNKNOWN"
+
+def frequency_to_band_hz(freq_hz):
+    """Convert an already normalized integer Hz frequency to band"""
+    i = bisect_right(_LOWERS, freq_hz) - 1
+    if i >= 0 and freq_hz <= _UPPERS[i]:
+        return _NAMES[i]
+    
+    logger.warning("No band for frequency: %s Hz", freq_hz)
+    return "UNKNOWN"
+
+def normalize_frequency(freq_str):
+    """Normalize frequency to Hz"""
+    return _normalize_frequency_hz(str(freq_str))
 
 class BandConverter:
-    """Frequency to band converter"""
+    """Frequency to band converter (thin wrapper over the module-level tables)"""
+    
+    # {(freq_min_hz, freq_max_hz): band}, kept for callers inspecting the table
+    bands = {(freq_min, freq_max): band for freq_min, freq_max, band in _BANDS}
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        
-        self.bands = {
-            (135700, 137800): "2200M",
-            (472000, 479000): "630M",
-            (1800000, 2000000): "160M",
-            (3500000, 4000000): "80M",
-            (5330500, 5406500): "60M",
-            (7000000, 7300000): "40M",
-            (10100000, 10150000): "30M",
-            (14000000, 14350000): "20M",
-            (18068000, 18168000): "17M",
-            (21000000, 21450000): "15M",
-            (24890000, 24990000): "12M",
-            (28000000, 29700000): "10M",
-            (50000000, 54000000): "6M",
-            (70000000, 70500000): "4M",
-            (144000000, 148000000): "2M",
-            (222000000, 225000000): "1.25M",
-            (430000000, 440000000): "70CM",
-            (902000000, 928000000): "33CM",
-            (1240000000, 1300000000): "23CM",
-            (2300000000, 2450000000): "13CM",
-            (3300000000, 3500000000): "9CM",
-            (5650000000, 5925000000): "6CM",
-            (10000000000, 10500000000): "3CM",
-        }
-        
+        self.logger = logger
         self.logger.info("Band converter initialized")
     
     def frequency_to_band(self, frequency_str):
         """Convert frequency to band"""
-        try:
-            freq_hz = self._normalize_frequency(frequency_str)
-            
-            if freq_hz is None:
-                self.logger.warning(f"Invalid frequency: {frequency_str}")
-                return "UNKNOWN"
-            
-            for (freq_min, freq_max), band in self.bands.items():
-                if freq_min <= freq_hz <= freq_max:
-                    return band
-            
-            self.logger.warning(f"No band for frequency: {freq_hz} Hz")
-            return "UNKNOWN"
-            
-        except Exception as e:
-            self.logger.error(f"Band conversion error: {e}")
-            return "UNKNOWN"
+        return frequency_to_band(frequency_str)
+    
+    def frequency_to_band_hz(self, freq_hz):
+        """Convert integer Hz frequency to band, skipping text normalization"""
+        return frequency_to_band_hz(freq_hz)
     
     def _normalize_frequency(self, freq_str):
         """Normalize frequency to Hz"""
-        try:
-            freq_clean = ''.join(c for c in str(freq_str) if c.isdigit() or c == '.')
-            
-            if not freq_clean:
-                return None
-            
-            freq_num = float(freq_clean)
-            
-            if freq_num < 1000:
-                return int(freq_num * 1000000)
-            elif freq_num < 1000000:
-                return int(freq_num * 1000)
-            elif freq_num < 1000000000:
-                return int(freq_num)
-            else:
-                return int(freq_num)
-                
-        except (ValueError, TypeError):
-            return None
+        return normalize_frequency(freq_str)
     
     def get_all_bands(self):
         """Get all supported bands"""
-        return sorted(set(self.bands.values()))
\ No newline at end of file
+        return sorted(set(_NAMES))
@@ -6,27 +6,120 @@ Date: 2025-09-02 19:20:13
 User: ertig3
 """
 
+import codecs
 import logging
 import re
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from sys import intern
+
+# Common spellings of the QSO line tag, checked without allocating (others via upper())
+_QSO_PREFIXES = ('QSO:', 'qso:')
+# QSO line positions (frequency, mode, date, transmitter id) with few distinct values
+_INTERNED_FIELDS = (0, 1, 2, 10)
+# Cabrillo header tag -> contest_info key (ADDRESS lines are collected separately)
+_HEADER_FIELDS = {
+    'CONTEST': 'contest',
+    'CALLSIGN': 'callsign',
+    'CATEGORY-OPERATOR': 'category_operator',
+    'CATEGORY-TRANSMITTER': 'category_transmitter',
+    'CATEGORY-POWER': 'category_power',
+    'CATEGORY-BAND': 'category_band',
+    'CATEGORY-MODE': 'category_mode',
+    'CLAIMED-SCORE': 'claimed_score',
+    'CLUB': 'club',
+    'LOCATION': 'location',
+    'NAME': 'name',
+    'EMAIL': 'email',
+    'OPERATORS': 'operators',
+    'CREATED-BY': 'created_by'
+}
+# Common QSO tag variations reported by _debug_file_content()
+_QSO_VARIATIONS = ('QSO:', 'qso:', 'QSO ', 'qso ')
+# Date formats accepted in QSO lines, tried in order
+_DATE_FORMATS = ('%Y-%m-%d', '%Y%m%d', '%m/%d/%Y', '%d.%m.%Y')
+# HHMM with valid hour/minute, matched after colons are removed
+_TIME_RE = re.compile(r'([01]\d|2[0-3])[0-5]\d')
+# Band edges (kHz) counted by get_statistics(), sorted by lower bound for bisect
+_STATS_BAND_LO = (1800, 3500, 7000, 14000, 21000, 28000, 50000, 144000)
+_STATS_BAND_HI = (2000, 4000, 7300, 14350, 21450, 29700, 54000, 148000)
+_STATS_BAND_NAMES = ('160M', '80M', '40M', '20M', '15M', '10M', '6M', '2M')
+
+@lru_cache(maxsize=64)
+def _is_valid_date(date_str):
+    """Validate date format; cached, a contest log spans only a few dates"""
+    # Try different date formats
+    for fmt in _DATE_FORMATS:
+        try:
+            datetime.strptime(date_str, fmt)
+            return True
+        except (ValueError, TypeError):
+            continue
+    return False
+
+@lru_cache(maxsize=4096)
+def _is_valid_time(time_str):
+    """Validate time format; cached, there are only 1440 distinct HHMM values"""
+    try:
+        # Common time formats: HHMM, HH:MM
+        time_clean = time_str.replace(':', '') if ':' in time_str else time_str
+        return _TIME_RE.fullmatch(time_clean) is not None
+    except (ValueError, TypeError):
+        return False
+
+def decode_cabrillo(data, final=True):
+    """Decode Cabrillo bytes (UTF-8 with or without BOM, else cp1252), return (text, encoding)"""
+    if data[:3] == b'\xef\xbb\xbf':
+        encoding = 'utf-8-sig'
+        errors = 'replace'
+    else:
+        encoding = 'utf-8'
+        errors = 'strict'
+    
+    try:
+        if final:
+            text = data.decode(encoding, errors)
+        else:
+            # A head cut from a longer file: hold back a multibyte character split at the end
+            text = codecs.getincrementaldecoder(encoding)(errors).decode(data, final=False)
+    except UnicodeDecodeError:
+        encoding = 'cp1252'
+        text = data.decode(encoding, errors='replace')
+    
+    # Universal newlines, as text-mode open() did: CRLF and lone CR become '\n'
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return text, encoding
 
 class CabrilloQSO:
     """Represents a single QSO from Cabrillo log"""
     
-    def __init__(self):
-        self.frequency = ""
-        self.mode = ""
-        self.date = ""
-        self.time = ""
-        self.my_call = ""
-        self.my_rst_sent = ""
-        self.my_exchange_sent = ""
-        self.dx_call = ""
-        self.dx_rst_rcvd = ""
-        self.dx_exchange_rcvd = ""
-        self.transmitter_id = ""
-        self.raw_line = ""
+    # Fixed field set (read by ADIFGenerator); no per-QSO __dict__
+    __slots__ = (
+        'frequency', 'mode', 'date', 'time', 'my_call', 'my_rst_sent',
+        'my_exchange_sent', 'dx_call', 'dx_rst_rcvd', 'dx_exchange_rcvd',
+        'transmitter_id', 'raw_line'
+    )
+    
+    def __init__(self, frequency="", mode="", date="", time="", my_call="",
+                 my_rst_sent="", my_exchange_sent="", dx_call="", dx_rst_rcvd="",
+                 dx_exchange_rcvd="", transmitter_id="", raw_line=""):
+        # Positional order follows the Cabrillo QSO line
+        self.frequency = frequency
+        self.mode = mode
+        self.date = date
+        self.time = time
+        self.my_call = my_call
+        self.my_rst_sent = my_rst_sent
+        self.my_exchange_sent = my_exchange_sent
+        self.dx_call = dx_call
+        self.dx_rst_rcvd = dx_rst_rcvd
+        self.dx_exchange_rcvd = dx_exchange_rcvd
+        self.transmitter_id = transmitter_id
+        self.raw_line = raw_line
 
 class CabrilloParser:
     """Parses Cabrillo contest log files"""
@@ -35,6 +128,7 @@ class CabrilloParser:
         self.logger = logging.getLogger(__name__)
         self.contest_info = {}
         self.qsos = []
+        self._reset_statistics()
         
         self.logger.info("Cabrillo parser initialized")
     
@@ -42,238 +136,235 @@ class CabrilloParser:
         """Parse Cabrillo file and return QSOs"""
         self.qsos = []
         self.contest_info = {}
+        self._reset_statistics()
         
         try:
-            file_path = Path(filename)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {filename}")
-            
-            self.logger.info(f"Parsing Cabrillo file: {filename}")
-            
-            # Try different encodings
-            content = None
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                        content = f.read()
-                    self.logger.info(f"Successfully read file with {encoding} encoding")
-                    break
-                except Exception as e:
-                    self.logger.warning(f"Failed to read with {encoding}: {e}")
-                    continue
-            
-            if not content:
-                raise Exception("Could not read file with any encoding")
-            
-            lines = content.split('\n')
-            qso_count = 0
-            
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                if not line or line.startswith('#'):
-                    continue
-                
-                try:
-                    if line.upper().startswith('QSO:'):
-                        qso = self._parse_qso_line(line)
-                        if qso:
-                            self.qsos.append(qso)
-                            qso_count += 1
-                            self.logger.debug(f"Parsed QSO {qso_count}: {qso.dx_call}")
-                    else:
-                        self._parse_header_line(line)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error parsing line {line_num}: {e}")
-                    self.logger.debug(f"Problematic line: {line}")
-                    continue
-            
-            self.logger.info(f"Parsed {qso_count} QSOs from {filename}")
-            
-            if qso_count == 0:
-                self.logger.warning("No QSOs found - checking file format")
-                self._debug_file_content(content)
+            content = self._read_file(filename)
+            qso_count = self._parse_lines(content)
+            self._finish_parse(filename, qso_count, content)
+            return self.qsos
             
+        except Exception as e:
+            self.logger.error("Error parsing Cabrillo file: %s", e)
+            raise
+    
+    def parse_bytes(self, data, source="<memory>"):
+        """Parse Cabrillo content already read into memory and return QSOs"""
+        self.qsos = []
+        self.contest_info = {}
+        self._reset_statistics()
+        
+        try:
+            self.logger.info("Parsing Cabrillo data: %s", source)
+            content = self._decode(data)
+            qso_count = self._parse_lines(content)
+            self._finish_parse(source, qso_count, content)
             return self.qsos
             
         except Exception as e:
-            self.logger.error(f"Error parsing Cabrillo file: {e}")
+            self.logger.error("Error parsing Cabrillo file: %s", e)
             raise
     
+    def _read_file(self, filename):
+        """Read and decode a Cabrillo file"""
+        file_path = Path(filename)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {filename}")
+        
+        self.logger.info("Parsing Cabrillo file: %s", filename)
+        
+        return self._decode(file_path.read_bytes())
+    
+    def _decode(self, data):
+        """Decode raw Cabrillo bytes"""
+        content, encoding = decode_cabrillo(data)
+        self.logger.info("Successfully read file with %s encoding", encoding)
+        
+        if not content:
+            raise Exception("Could not read file with any encoding")
+        
+        return content
+    
+    def _parse_lines(self, content):
+        """Parse header and QSO lines from decoded text, return number of QSOs added"""
+        qso_count = 0
+        
+        # Per-line lookups bound once for the loop
+        log = self.logger
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        parse_qso_line = self._parse_qso_line
+        parse_header_line = self._parse_header_line
+        append_qso = self.qsos.append
+        
+        for line_num, line in enumerate(content.split('\n'), 1):
+            line = line.strip()
+            
+            if not line or line.startswith('#'):
+                continue
+            
+            try:
+                if line.startswith(_QSO_PREFIXES) or line[:4].upper() == 'QSO:':
+                    qso = parse_qso_line(line, line[4:].strip())
+                    if qso:
+                        append_qso(qso)
+                        qso_count += 1
+                        if debug_enabled:
+                            log.debug("Parsed QSO %s: %s", qso_count, qso.dx_call)
+                else:
+                    parse_header_line(line)
+                    
+            except Exception as e:
+                log.warning("Error parsing line %s: %s", line_num, e)
+                log.debug("Problematic line: %s", line)
+                continue
+        
+        return qso_count
+    
+    def _finish_parse(self, filename, qso_count, content):
+        """Log the parse result, diagnosing the file format when no QSOs were found"""
+        self.logger.info("Parsed %s QSOs from %s", qso_count, filename)
+        
+        if qso_count == 0:
+            self.logger.warning("No QSOs found - checking file format")
+            self._debug_file_content(content)
+    
     def _debug_file_content(self, content):
         """Debug file content to understand format"""
-        lines = content.split('\n')
-        qso_lines = [line for line in lines if 'QSO' in line.upper()]
+        variation_counts = dict.fromkeys(_QSO_VARIATIONS, 0)
+        qso_line_count = 0
+        samples = []
         
-        self.logger.info(f"Found {len(qso_lines)} lines containing 'QSO'")
+        # One pass over the lines, no per-variation rescans
+        for line in content.split('\n'):
+            if 'QSO' in line.upper():
+                qso_line_count += 1
+                if len(samples) < 5:  # Show first 5 QSO lines
+                    samples.append(line)
+            
+            stripped = line.strip()
+            if stripped.startswith(_QSO_VARIATIONS):
+                for var in _QSO_VARIATIONS:
+                    if stripped.startswith(var):
+                        variation_counts[var] += 1
         
-        for i, line in enumerate(qso_lines[:5]):  # Show first 5 QSO lines
-            self.logger.info(f"QSO line {i+1}: {repr(line)}")
-            
-        # Check for common variations
-        variations = ['QSO:', 'qso:', 'QSO ', 'qso ']
-        for var in variations:
-            count = len([line for line in lines if line.strip().startswith(var)])
+        self.logger.info("Found %s lines containing 'QSO'", qso_line_count)
+        
+        for i, line in enumerate(samples):
+            self.logger.info("QSO line %s: %r", i + 1, line)
+        
+        for var, count in variation_counts.items():
             if count > 0:
-                self.logger.info(f"Found {count} lines starting with '{var}'")
+                self.logger.info("Found %s lines starting with '%s'", count, var)
     
-    def _parse_qso_line(self, line):
+    def _parse_qso_line(self, line, line_data=None):
         """Parse a QSO line with flexible format handling"""
+        log = self.logger
         try:
-            self.logger.debug(f"Parsing QSO line: {line}")
+            log.debug("Parsing QSO line: %s", line)
             
-            # Remove "QSO:" prefix and clean whitespace
-            if line.upper().startswith('QSO:'):
-                line_data = line[4:].strip()
-            else:
-                line_data = line.strip()
+            # Remove "QSO:" prefix and clean whitespace (parse_file passes it pre-split)
+            if line_data is None:
+                if line.startswith(_QSO_PREFIXES) or line[:4].upper() == 'QSO:':
+                    line_data = line[4:].strip()
+                else:
+                    line_data = line.strip()
             
             # Split by whitespace, handling multiple spaces
             parts = line_data.split()
             
             if len(parts) < 10:
-                self.logger.warning(f"QSO line has only {len(parts)} parts, need at least 10: {line}")
+                log.warning("QSO line has only %s parts, need at least 10: %s", len(parts), line)
                 # Try to parse what we have
                 if len(parts) < 6:
                     return None
             
-            qso = CabrilloQSO()
-            qso.raw_line = line
-            
             try:
                 # Standard Cabrillo format:
                 # freq mode date time mycall sent_rst sent_ex dxcall rcvd_rst rcvd_ex [transmitter]
-                qso.frequency = parts[0] if len(parts) > 0 else ""
-                qso.mode = parts[1] if len(parts) > 1 else ""
-                qso.date = parts[2] if len(parts) > 2 else ""
-                qso.time = parts[3] if len(parts) > 3 else ""
-                qso.my_call = parts[4] if len(parts) > 4 else ""
-                qso.my_rst_sent = parts[5] if len(parts) > 5 else ""
-                qso.my_exchange_sent = parts[6] if len(parts) > 6 else ""
-                qso.dx_call = parts[7] if len(parts) > 7 else ""
-                qso.dx_rst_rcvd = parts[8] if len(parts) > 8 else ""
-                qso.dx_exchange_rcvd = parts[9] if len(parts) > 9 else ""
-                
-                if len(parts) > 10:
-                    qso.transmitter_id = parts[10]
+                # Missing trailing fields take the constructor defaults, extra ones are ignored
+                fields = parts[:11]
+                # Frequency, mode, date and transmitter id repeat across the log: share one object each
+                for i in _INTERNED_FIELDS:
+                    if i < len(fields):
+                        fields[i] = intern(fields[i])
+                qso = CabrilloQSO(*fields, raw_line=line)
                 
                 # Alternative format handling - some logs have different field order
                 if not qso.dx_call and len(parts) > 7:
                     # Try alternative parsing
-                    self.logger.debug("Trying alternative QSO format")
+                    log.debug("Trying alternative QSO format")
                     
                 # Validate essential fields
                 if not qso.dx_call:
-                    self.logger.warning(f"No DX call found in QSO: {line}")
+                    log.warning("No DX call found in QSO: %s", line)
                     return None
                 
                 if not qso.my_call:
-                    self.logger.warning(f"No station call found in QSO: {line}")
+                    log.warning("No station call found in QSO: %s", line)
                     return None
                 
                 # Clean up callsigns
                 qso.dx_call = qso.dx_call.strip().upper()
                 qso.my_call = qso.my_call.strip().upper()
                 
-                # Validate frequency
-                if qso.frequency:
+                # Validate frequency (integer kHz is the norm; decimals still accepted)
+                freq = qso.frequency
+                if freq and not (freq.isascii() and freq.isdigit()):
                     try:
-                        float(qso.frequency)
+                        float(freq)
                     except ValueError:
-                        self.logger.warning(f"Invalid frequency: {qso.frequency}")
+                        log.warning("Invalid frequency: %s", qso.frequency)
                         qso.frequency = ""
                 
                 # Validate date format
                 if qso.date:
                     if not self._validate_date(qso.date):
-                        self.logger.warning(f"Invalid date format: {qso.date}")
+                        log.warning("Invalid date format: %s", qso.date)
                         qso.date = ""
                 
                 # Validate time format
                 if qso.time:
                     if not self._validate_time(qso.time):
-                        self.logger.warning(f"Invalid time format: {qso.time}")
+                        log.warning("Invalid time format: %s", qso.time)
                         qso.time = ""
                 
-                self.logger.debug(f"Successfully parsed QSO: {qso.my_call} -> {qso.dx_call}")
+                log.debug("Successfully parsed QSO: %s -> %s", qso.my_call, qso.dx_call)
                 return qso
                 
             except Exception as e:
-                self.logger.error(f"Error parsing QSO fields: {e}")
+                log.error("Error parsing QSO fields: %s", e)
                 return None
             
         except Exception as e:
-            self.logger.error(f"Error parsing QSO line: {e}")
+            log.error("Error parsing QSO line: %s", e)
             return None
     
     def _validate_date(self, date_str):
         """Validate date format"""
-        try:
-            # Try different date formats
-            formats = ['%Y-%m-%d', '%Y%m%d', '%m/%d/%Y', '%d.%m.%Y']
-            for fmt in formats:
-                try:
-                    datetime.strptime(date_str, fmt)
-                    return True
-                except ValueError:
-                    continue
-            return False
-        except:
-            return False
+        return _is_valid_date(date_str)
     
     def _validate_time(self, time_str):
         """Validate time format"""
-        try:
-            # Common time formats: HHMM, HH:MM
-            time_clean = time_str.replace(':', '')
-            if len(time_clean) == 4 and time_clean.isdigit():
-                hour = int(time_clean[:2])
-                minute = int(time_clean[2:])
-                return 0 <= hour <= 23 and 0 <= minute <= 59
-            return False
-        except:
-            return False
+        return _is_valid_time(time_str)
     
     def _parse_header_line(self, line):
         """Parse header line and extract contest information"""
         try:
-            if ':' not in line:
+            idx = line.find(':')
+            if idx < 0:
                 return
             
-            key, value = line.split(':', 1)
-            key = key.strip().upper()
-            value = value.strip()
+            key = line[:idx].strip().upper()
             
             # Store important contest information
-            header_fields = {
-                'CONTEST': 'contest',
-                'CALLSIGN': 'callsign',
-                'CATEGORY-OPERATOR': 'category_operator',
-                'CATEGORY-TRANSMITTER': 'category_transmitter',
-                'CATEGORY-POWER': 'category_power',
-                'CATEGORY-BAND': 'category_band',
-                'CATEGORY-MODE': 'category_mode',
-                'CLAIMED-SCORE': 'claimed_score',
-                'CLUB': 'club',
-                'LOCATION': 'location',
-                'NAME': 'name',
-                'EMAIL': 'email',
-                'OPERATORS': 'operators',
-                'CREATED-BY': 'created_by'
-            }
-            
-            if key in header_fields:
-                self.contest_info[header_fields[key]] = value
+            field = _HEADER_FIELDS.get(key)
+            if field is not None:
+                self.contest_info[field] = line[idx + 1:].strip()
             elif key == 'ADDRESS':
-                if 'address' not in self.contest_info:
-                    self.contest_info['address'] = []
-                self.contest_info['address'].append(value)
+                self.contest_info.setdefault('address', []).append(line[idx + 1:].strip())
             
         except Exception as e:
-            self.logger.warning(f"Error parsing header line: {e}")
+            self.logger.warning("Error parsing header line: %s", e)
     
     def get_contest_info(self):
         """Return parsed contest information"""
@@ -285,21 +376,53 @@ class CabrilloParser:
     
     def validate_qsos(self):
         """Validate parsed QSOs"""
-        valid_qsos = []
-        invalid_count = 0
-        
-        for qso in self.qsos:
-            if self._validate_qso(qso):
-                valid_qsos.append(qso)
-            else:
-                invalid_count += 1
-                self.logger.debug(f"Invalid QSO: {qso.raw_line}")
+        self._ensure_statistics()
+        valid_qsos = list(self._valid_qsos)
+        invalid_count = self._stats_count - len(valid_qsos)
         
         if invalid_count > 0:
-            self.logger.warning(f"Found {invalid_count} invalid QSOs")
+            self.logger.warning("Found %s invalid QSOs", invalid_count)
         
         return valid_qsos
     
+    def _reset_statistics(self):
+        """Invalidate statistics; they are rebuilt on first request"""
+        self._stats_qsos = self.qsos
+        self._stats_count = 0
+        self._valid_qsos = []
+        self._modes = set()
+        self._bands_mask = 0
+    
+    def _accumulate_qso(self, qso):
+        """Add one QSO to the statistics and validity lists"""
+        self._stats_count += 1
+        if self._validate_qso(qso):
+            self._valid_qsos.append(qso)
+        else:
+            self.logger.debug("Invalid QSO: %s", qso.raw_line)
+        
+        if qso.mode:
+            self._modes.add(qso.mode)
+        
+        # Extract band from frequency
+        freq_text = qso.frequency
+        if freq_text:
+            try:
+                freq = int(freq_text) if freq_text.isascii() and freq_text.isdigit() else float(freq_text)
+                i = bisect_right(_STATS_BAND_LO, freq) - 1
+                if i >= 0 and freq <= _STATS_BAND_HI[i]:
+                    self._bands_mask |= 1 << i
+            except ValueError:
+                pass
+    
+    def _ensure_statistics(self):
+        """Build statistics lazily, or rebuild them if self.qsos was replaced or changed"""
+        if self._stats_qsos is self.qsos and self._stats_count == len(self.qsos):
+            return
+        self._reset_statistics()
+        for qso in self.qsos:
+            self._accumulate_qso(qso)
+    
     def _validate_qso(self, qso):
         """Validate a single QSO"""
         try:
@@ -318,59 +441,30 @@ class CabrilloParser:
     
     def get_statistics(self):
         """Return parsing statistics"""
+        self._ensure_statistics()
         stats = {
             'total_qsos': len(self.qsos),
-            'valid_qsos': len(self.validate_qsos()),
+            'valid_qsos': len(self._valid_qsos),
             'contest_name': self.contest_info.get('contest', 'Unknown'),
             'station_call': self.contest_info.get('callsign', 'Unknown'),
-            'modes': set(),
-            'bands': set()
+            # Built on demand (see _ensure_statistics)
+            'modes': list({mode.upper() for mode in self._modes}),
+            'bands': [band for i, band in enumerate(_STATS_BAND_NAMES) if self._bands_mask >> i & 1]
         }
         
-        for qso in self.qsos:
-            if qso.mode:
-                stats['modes'].add(qso.mode.upper())
-            
-            # Extract band from frequency
-            if qso.frequency:
-                try:
-                    freq = float(qso.frequency)
-                    if freq >= 1800 and freq <= 2000:
-                        stats['bands'].add('160M')
-                    elif freq >= 3500 and freq <= 4000:
-                        stats['bands'].add('80M')
-                    elif freq >= 7000 and freq <= 7300:
-                        stats['bands'].add('40M')
-                    elif freq >= 14000 and freq <= 14350:
-                        stats['bands'].add('20M')
-                    elif freq >= 21000 and freq <= 21450:
-                        stats['bands'].add('15M')
-                    elif freq >= 28000 and freq <= 29700:
-                        stats['bands'].add('10M')
-                    elif freq >= 50000 and freq <= 54000:
-                        stats['bands'].add('6M')
-                    elif freq >= 144000 and freq <= 148000:
-                        stats['bands'].add('2M')
-                except ValueError:
-                    pass
-        
-        # Convert sets to lists
-        stats['modes'] = list(stats['modes'])
-        stats['bands'] = list(stats['bands'])
-        
         return stats
     
     def debug_parse_file(self, filename):
         """Debug version of parse_file with detailed logging"""
         try:
             file_path = Path(filename)
-            self.logger.info(f"Debug parsing: {filename}")
+            self.logger.info("Debug parsing: %s", filename)
             
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
             
             lines = content.split('\n')
-            self.logger.info(f"File has {len(lines)} lines")
+            self.logger.info("File has %s lines", len(lines))
             
             # Look for QSO lines
             qso_lines = []
@@ -378,16 +472,16 @@ class CabrilloParser:
                 if 'QSO' in line.upper():
                     qso_lines.append((i+1, line.strip()))
             
-            self.logger.info(f"Found {len(qso_lines)} potential QSO lines")
+            self.logger.info("Found %s potential QSO lines", len(qso_lines))
             
             # Show first few QSO lines
             for line_num, line in qso_lines[:3]:
-                self.logger.info(f"Line {line_num}: {repr(line)}")
+                self.logger.info("Line %s: %r", line_num, line)
                 parts = line.split()
-                self.logger.info(f"  Parts ({len(parts)}): {parts}")
+                self.logger.info("  Parts (%s): %s", len(parts), parts)
             
             return qso_lines
             
         except Exception as e:
-            self.logger.error(f"Debug parse error: {e}")
+            self.logger.error("Debug parse error: %s", e)
             return []
\ No newline at end of file
@@ -10,15 +10,49 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 import sys
+import contextlib
 import webbrowser
 import logging
-from datetime import datetime
+import queue
+import subprocess
+import threading
+import time
 from pathlib import Path
 
 from translations import translator, _
-from cabrillo_parser import CabrilloParser
+from cabrillo_parser import CabrilloParser, decode_cabrillo
 from adif_generator import ADIFGenerator
 
+# Line prefixes preview_file_info looks at; every other line is skipped by one startswith()
+_PREVIEW_PREFIXES = ('QSO:', 'CONTEST:', 'CALLSIGN:')
+
+# Characters of the input shown in the file preview
+_PREVIEW_CHARS = 2000
+
+# Preview lines fetched from the Text widget per write in save_preview
+_SAVE_CHUNK_LINES = 4096
+
+def _now_token():
+    """Current UTC time as a filename token (YYYYmmdd_HHMMSS)"""
+    return time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+
+def _now_human():
+    """Current UTC time for display (YYYY-mm-dd HH:MM:SS UTC)"""
+    return time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
+
+def _start_file(path):
+    """os.startfile() for a background thread; failures are logged"""
+    try:
+        os.startfile(path)
+    except OSError as e:
+        logging.getLogger(__name__).error(f"Error opening output folder: {e}")
+
+def _tcl_word(value):
+    """Quote a value (tuples become Tcl lists) as one word of a Tcl script"""
+    if isinstance(value, tuple):
+        return "{" + " ".join(_tcl_word(item) for item in value) + "}"
+    return "{" + str(value) + "}"
+
 class ModernTheme:
     """Dark theme configuration"""
     
@@ -43,6 +77,66 @@ class ModernTheme:
 class Cabrillo2ADIFConverterGUI:
     """Main application GUI class"""
     
+    # Shared option sets for the panel labels, unpacked into tk.Label
+    _LABEL_HEADING = {'font': ('Segoe UI', 11, 'bold'),
+                      'fg': ModernTheme.TEXT_PRIMARY, 'bg': ModernTheme.PANEL_BG}
+    _LABEL_SECONDARY = {'font': ('Segoe UI', 10),
+                        'fg': ModernTheme.TEXT_SECONDARY, 'bg': ModernTheme.PANEL_BG}
+    
+    # Language-independent lines of the about/help dialogs, joined after the translated headings
+    _ABOUT_STATIC = (
+        "",
+        "GitHub: github.com/ertig3",
+        "Date: 2025-09-02 19:37:45 UTC",
+        "",
+        "FEATURES:",
+        "- ADIF 3.1.4 output",
+        "- Multi-language support",
+        "- Modern dark theme",
+        "- Real-time preview",
+        "- Error handling",
+        "",
+        "SUPPORTED FORMATS:",
+        "- Input: Cabrillo (.cbr, .log, .txt)",
+        "- Output: ADIF 3.1.4 (.adi)",
+        "",
+        "SUPPORTED BANDS:",
+        "- HF: 160M-10M",
+        "- VHF/UHF: 6M-3CM",
+        "- LF: 2200M-630M",
+        "",
+        "For amateur radio community",
+        "",
+    )
+    _HELP_QUICKSTART = (
+        "1. Select Cabrillo file",
+        "2. Choose ADIF output location",
+        "3. Click START CONVERSION",
+        "4. Review results",
+        "",
+    )
+    _HELP_FORMATS = (
+        "- Cabrillo: .cbr, .log, .txt",
+        "- ADIF: .adi (version 3.1.4)",
+        "",
+    )
+    _HELP_FEATURES = (
+        "- File selection",
+        "- Live preview",
+        "- Multi-language",
+        "- Dark theme",
+        "- Error handling",
+        "",
+        "TROUBLESHOOTING:",
+        "- Check file format",
+        "- Verify permissions",
+        "- Use test file",
+        "- Check error messages",
+        "- Ensure disk space",
+        "",
+        "GitHub: github.com/ertig3 | ",
+    )
+    
     def __init__(self, settings):
         self.settings = settings
         self.logger = logging.getLogger(__name__)
@@ -59,86 +153,132 @@ class Cabrillo2ADIFConverterGUI:
         self.input_file = tk.StringVar()
         self.output_file = tk.StringVar()
         self.status_text = tk.StringVar(value=_('status_ready'))
+        # Status updates waiting for _apply_status, see _set_status
+        self._pending_status = None
+        self._pending_indicator = None
+        self._status_scheduled = False
         self.qso_count = tk.StringVar(value="0 QSOs")
         
+        # Path objects for the current entries, rebuilt only when a variable is written
+        self._input_path = None
+        self._output_path = None
+        self.input_file.trace_add('write', self._on_input_changed)
+        self.output_file.trace_add('write', self._on_output_changed)
+        
         self.default_output_dir = Path(settings.get_output_directory())
         
+        # Formatted welcome text, rebuilt after a language change
+        self._welcome_cache = None
+        # {language code: dialog body} for show_about / show_help
+        self._about_cache = {}
+        self._help_cache = {}
+        
+        # Last text shown by update_timestamp
+        self._last_timestamp = None
+        
+        # Conversion worker -> Tk main thread messages, see _drain_queue
+        self._ui_queue = queue.Queue()
+        self._conversion_thread = None
+        
         self.setup_styling()
         self.setup_menu()
         self.setup_gui()
         
         self.logger.info("GUI initialized - ertig3")
         
+    def _on_input_changed(self, *args):
+        """Refresh the cached input Path after the input variable changes"""
+        value = self.input_file.get()
+        self._input_path = Path(value) if value else None
+        
+    def _on_output_changed(self, *args):
+        """Refresh the cached output Path after the output variable changes"""
+        value = self.output_file.get()
+        self._output_path = Path(value) if value else None
+        
+    def _set_status(self, bar, indicator=None, color=None):
+        """Queue status bar text (and indicator text/colour) for the next idle pass"""
+        # One pending slot and one idle callback: the latest call in program order wins
+        self._pending_status = bar
+        if indicator is not None:
+            self._pending_indicator = (indicator, color)
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._apply_status)
+        
+    def _apply_status(self):
+        """Write the queued status bar text and indicator"""
+        self._status_scheduled = False
+        self.status_text.set(self._pending_status)
+        if self._pending_indicator is not None:
+            text, color = self._pending_indicator
+            self._pending_indicator = None
+            self.status_display.config(text=text, fg=color)
+        
     def setup_styling(self):
         """Configure dark theme styling"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        style.configure('.',
-                       background=self.theme.DARK_BG,
-                       foreground=self.theme.TEXT_PRIMARY,
-                       fieldbackground=self.theme.INPUT_BG,
-                       bordercolor=self.theme.BORDER_COLOR)
-        
-        style.configure('Title.TLabel',
-                       font=('Segoe UI', 24, 'bold'),
-                       foreground=self.theme.ACCENT_BLUE,
-                       background=self.theme.DARK_BG)
-        
-        style.configure('Subtitle.TLabel',
-                       font=('Segoe UI', 12),
-                       foreground=self.theme.TEXT_SECONDARY,
-                       background=self.theme.DARK_BG)
-        
-        style.configure('Header.TLabel',
-                       font=('Segoe UI', 14, 'bold'),
-                       foreground=self.theme.TEXT_PRIMARY,
-                       background=self.theme.DARK_BG)
-        
-        style.configure('Modern.TButton',
-                       font=('Segoe UI', 11),
-                       foreground=self.theme.TEXT_PRIMARY,
-                       background=self.theme.BUTTON_BG,
-                       borderwidth=1,
-                       focuscolor='none')
-        
-        style.map('Modern.TButton',
-                 background=[('active', self.theme.HOVER_BG),
-                            ('pressed', self.theme.ACCENT_BLUE)])
-        
-        style.configure('Accent.TButton',
-                       font=('Segoe UI', 12, 'bold'),
-                       foreground=self.theme.TEXT_PRIMARY,
-                       background=self.theme.ACCENT_BLUE,
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Accent.TButton',
-                 background=[('active', '#106ebe'),
-                            ('pressed', '#005a9e')])
-        
-        style.configure('Modern.TLabelframe',
-                       background=self.theme.PANEL_BG,
-                       bordercolor=self.theme.BORDER_COLOR,
-                       borderwidth=1,
-                       relief='solid')
-        
-        style.configure('Modern.TLabelframe.Label',
-                       font=('Segoe UI', 11, 'bold'),
-                       foreground=self.theme.ACCENT_BLUE,
-                       background=self.theme.PANEL_BG)
-        
-        style.configure('Modern.TEntry',
-                       font=('Consolas', 10),
-                       foreground=self.theme.TEXT_PRIMARY,
-                       fieldbackground=self.theme.INPUT_BG,
-                       bordercolor=self.theme.BORDER_COLOR,
-                       insertcolor=self.theme.TEXT_PRIMARY)
-        
-        style.configure('Modern.Horizontal.TProgressbar',
-                       background=self.theme.ACCENT_BLUE,
-                       troughcolor=self.theme.INPUT_BG,
-                       borderwidth=0)
+        theme = self.theme
+        
+        # (style, options) for ttk::style configure
+        styles = (
+            ('.', {'background': theme.DARK_BG,
+                   'foreground': theme.TEXT_PRIMARY,
+                   'fieldbackground': theme.INPUT_BG,
+                   'bordercolor': theme.BORDER_COLOR}),
+            ('Title.TLabel', {'font': ('Segoe UI', 24, 'bold'),
+                              'foreground': theme.ACCENT_BLUE,
+                              'background': theme.DARK_BG}),
+            ('Subtitle.TLabel', {'font': ('Segoe UI', 12),
+                                 'foreground': theme.TEXT_SECONDARY,
+                                 'background': theme.DARK_BG}),
+            ('Header.TLabel', {'font': ('Segoe UI', 14, 'bold'),
+                               'foreground': theme.TEXT_PRIMARY,
+                               'background': theme.DARK_BG}),
+            ('Modern.TButton', {'font': ('Segoe UI', 11),
+                                'foreground': theme.TEXT_PRIMARY,
+                                'background': theme.BUTTON_BG,
+                                'borderwidth': 1,
+                                'focuscolor': 'none'}),
+            ('Accent.TButton', {'font': ('Segoe UI', 12, 'bold'),
+                                'foreground': theme.TEXT_PRIMARY,
+                                'background': theme.ACCENT_BLUE,
+                                'borderwidth': 0,
+                                'focuscolor': 'none'}),
+            ('Modern.TLabelframe', {'background': theme.PANEL_BG,
+                                    'bordercolor': theme.BORDER_COLOR,
+                                    'borderwidth': 1,
+                                    'relief': 'solid'}),
+            ('Modern.TLabelframe.Label', {'font': ('Segoe UI', 11, 'bold'),
+                                          'foreground': theme.ACCENT_BLUE,
+                                          'background': theme.PANEL_BG}),
+            ('Modern.TEntry', {'font': ('Consolas', 10),
+                               'foreground': theme.TEXT_PRIMARY,
+                               'fieldbackground': theme.INPUT_BG,
+                               'bordercolor': theme.BORDER_COLOR,
+                               'insertcolor': theme.TEXT_PRIMARY}),
+            ('Modern.Horizontal.TProgressbar', {'background': theme.ACCENT_BLUE,
+                                                'troughcolor': theme.INPUT_BG,
+                                                'borderwidth': 0}),
+        )
+        
+        # (style, option, [(state, value), ...]) for ttk::style map
+        maps = (
+            ('Modern.TButton', 'background', [('active', theme.HOVER_BG),
+                                              ('pressed', theme.ACCENT_BLUE)]),
+            ('Accent.TButton', 'background', [('active', '#106ebe'),
+                                              ('pressed', '#005a9e')]),
+        )
+        
+        # One Tcl script instead of a Python->Tcl round trip per configure/map call
+        commands = ["ttk::style theme use clam"]
+        for style_name, options in styles:
+            args = " ".join(f"-{name} {_tcl_word(value)}" for name, value in options.items())
+            commands.append(f"ttk::style configure {_tcl_word(style_name)} {args}")
+        for style_name, option, states in maps:
+            spec = _tcl_word(tuple(item for pair in states for item in pair))
+            commands.append(f"ttk::style map {_tcl_word(style_name)} -{option} {spec}")
+        
+        self.root.tk.eval("\n".join(commands))
         
     def setup_menu(self):
         """Create application menu"""
@@ -190,10 +330,11 @@ class Cabrillo2ADIFConverterGUI:
         help_menu.add_command(label=_('menu_about'), command=self.show_about)
         help_menu.add_command(label=_('menu_help_content'), command=self.show_help)
         
-        self.root.bind('<Control-o>', lambda e: self.browse_input())
-        self.root.bind('<Control-s>', lambda e: self.browse_output())
+        # Handlers take an optional event so they can be bound directly
+        self.root.bind('<Control-o>', self.browse_input)
+        self.root.bind('<Control-s>', self.browse_output)
         self.root.bind('<Control-q>', lambda e: self.root.quit())
-        self.root.bind('<F1>', lambda e: self.show_help())
+        self.root.bind('<F1>', self.show_help)
         
     def setup_gui(self):
         """Build main interface"""
@@ -235,9 +376,9 @@ class Cabrillo2ADIFConverterGUI:
                              bg=self.theme.DARK_BG,
                              cursor="hand2")
         time_label.pack(anchor=tk.E)
-        time_label.bind("<Button-1>", lambda e: self.open_github())
+        time_label.bind("<Button-1>", self.open_github)
         
-    def open_github(self):
+    def open_github(self, event=None):
         """Open GitHub profile in browser"""
         try:
             webbrowser.open("https://github.com/ertig3")
@@ -250,10 +391,7 @@ class Cabrillo2ADIFConverterGUI:
                                    style='Modern.TLabelframe', padding=20)
         file_frame.pack(fill=tk.X, pady=(0, 20))
         
-        input_label = tk.Label(file_frame, text=_('input_file_label'),
-                              font=('Segoe UI', 11, 'bold'),
-                              fg=self.theme.TEXT_PRIMARY,
-                              bg=self.theme.PANEL_BG)
+        input_label = tk.Label(file_frame, text=_('input_file_label'), **self._LABEL_HEADING)
         input_label.pack(anchor=tk.W, pady=(0, 8))
         
         input_container = tk.Frame(file_frame, bg=self.theme.PANEL_BG)
@@ -268,10 +406,7 @@ class Cabrillo2ADIFConverterGUI:
                               width=12)
         input_btn.pack(side=tk.RIGHT)
         
-        output_label = tk.Label(file_frame, text=_('output_file_label'),
-                               font=('Segoe UI', 11, 'bold'),
-                               fg=self.theme.TEXT_PRIMARY,
-                               bg=self.theme.PANEL_BG)
+        output_label = tk.Label(file_frame, text=_('output_file_label'), **self._LABEL_HEADING)
         output_label.pack(anchor=tk.W, pady=(0, 8))
         
         output_container = tk.Frame(file_frame, bg=self.theme.PANEL_BG)
@@ -298,10 +433,7 @@ class Cabrillo2ADIFConverterGUI:
         qso_frame = tk.Frame(info_container, bg=self.theme.PANEL_BG)
         qso_frame.pack(side=tk.LEFT)
         
-        qso_label = tk.Label(qso_frame, text=_('qso_count'),
-                            font=('Segoe UI', 10),
-                            fg=self.theme.TEXT_SECONDARY,
-                            bg=self.theme.PANEL_BG)
+        qso_label = tk.Label(qso_frame, text=_('qso_count'), **self._LABEL_SECONDARY)
         qso_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.qso_display = tk.Label(qso_frame, textvariable=self.qso_count,
@@ -313,10 +445,7 @@ class Cabrillo2ADIFConverterGUI:
         status_frame = tk.Frame(info_container, bg=self.theme.PANEL_BG)
         status_frame.pack(side=tk.RIGHT)
         
-        status_label = tk.Label(status_frame, text=_('status_label'),
-                               font=('Segoe UI', 10),
-                               fg=self.theme.TEXT_SECONDARY,
-                               bg=self.theme.PANEL_BG)
+        status_label = tk.Label(status_frame, text=_('status_label'), **self._LABEL_SECONDARY)
         status_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.status_display = tk.Label(status_frame, text=_('status_ready'),
@@ -372,7 +501,8 @@ class Cabrillo2ADIFConverterGUI:
             text_container,
             height=25,
             width=120,
-            wrap=tk.WORD,
+            # ADIF/Cabrillo text is line based: no word-wrap layout, scroll horizontally instead
+            wrap=tk.NONE,
             font=('Consolas', 10),
             bg=self.theme.INPUT_BG,
             fg=self.theme.TEXT_PRIMARY,
@@ -382,13 +512,19 @@ class Cabrillo2ADIFConverterGUI:
             relief='flat',
             borderwidth=1
         )
-        self.preview_text.pack(fill=tk.BOTH, expand=True)
         
-        self.preview_text.vbar.configure(
+        scrollbar_colors = dict(
             bg=self.theme.PANEL_BG,
             troughcolor=self.theme.INPUT_BG,
             activebackground=self.theme.HOVER_BG
         )
+        hbar = tk.Scrollbar(text_container, orient=tk.HORIZONTAL,
+                            command=self.preview_text.xview, **scrollbar_colors)
+        hbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.preview_text.configure(xscrollcommand=hbar.set)
+        self.preview_text.pack(fill=tk.BOTH, expand=True)
+        
+        self.preview_text.vbar.configure(**scrollbar_colors)
         
         self.show_welcome_text()
         
@@ -414,9 +550,18 @@ class Cabrillo2ADIFConverterGUI:
         
     def show_welcome_text(self):
         """Display welcome information"""
+        welcome_text = self._welcome_cache
+        if welcome_text is None:
+            welcome_text = self._welcome_cache = self._build_welcome_text()
+        
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(1.0, welcome_text)
+        
+    def _build_welcome_text(self):
+        """Format the welcome information for the current language"""
         current_lang = self.settings.get('language', 'en')
         
-        welcome_text = f"""{_('welcome_title')}
+        return f"""{_('welcome_title')}
 {'='*80}
 {_('welcome_intro')}
 
@@ -453,17 +598,32 @@ GitHub: github.com/ertig3 | 2025-09-02 19:37:45 UTC
 {_('welcome_ready')}
 {'='*80}
 """
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, welcome_text)
         
     def update_timestamp(self):
         """Update timestamp display"""
-        current_time = datetime.utcnow().strftime("Updated: %Y-%m-%d %H:%M:%S UTC")
-        self.time_label.config(text=current_time)
-        self.root.after(30000, self.update_timestamp)
-        
-    def browse_input(self):
+        current_time = time.strftime("Updated: %Y-%m-%d %H:%M UTC", time.gmtime())
+        if current_time != self._last_timestamp:
+            self.time_label.config(text=current_time)
+            self._last_timestamp = current_time
+        self.root.after(60000, self.update_timestamp)
+        
+    def _conversion_running(self):
+        """True while the conversion worker thread is still alive"""
+        return self._conversion_thread is not None and self._conversion_thread.is_alive()
+        
+    def _busy(self, action):
+        """Refuse an action that would overwrite the preview or status of a running conversion"""
+        if not self._conversion_running():
+            return False
+        self.root.bell()
+        self.logger.info(f"Ignored {action} while a conversion is running")
+        return True
+        
+    def browse_input(self, event=None):
         """Select input Cabrillo file"""
+        if self._busy("file selection"):
+            return
+        
         filename = filedialog.askopenfilename(
             title=_('select_cabrillo'),
             filetypes=[
@@ -478,29 +638,29 @@ GitHub: github.com/ertig3 | 2025-09-02 19:37:45 UTC
         
         if filename:
             self.input_file.set(filename)
-            self.settings.set('last_input_dir', str(Path(filename).parent))
+            # Plain string splits; the Path for the entry is built by the input trace
+            parent, name = os.path.split(filename)
+            self.settings.set('last_input_dir', parent)
             
-            base_name = Path(filename).stem
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-            output_path = self.default_output_dir / f"{base_name}_converted_{timestamp}.adi"
-            self.output_file.set(str(output_path))
+            base_name = os.path.splitext(name)[0]
+            timestamp = _now_token()
+            output_path = os.path.join(self.default_output_dir, f"{base_name}_converted_{timestamp}.adi")
+            self.output_file.set(output_path)
             
-            self.status_text.set(_('status_file_loaded') + f": {Path(filename).name}")
-            self.status_display.config(text="File loaded", fg=self.theme.ACCENT_BLUE)
+            self._set_status(_('status_file_loaded') + f": {name}", "File loaded", self.theme.ACCENT_BLUE)
             self.preview_file_info()
             
             self.logger.info(f"Input file selected: {filename}")
             
-    def browse_output(self):
+    def browse_output(self, event=None):
         """Select output ADIF file"""
         initial_dir = self.settings.get('last_output_dir', str(self.default_output_dir))
         
-        if self.input_file.get():
-            base_name = Path(self.input_file.get()).stem
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        timestamp = _now_token()
+        if self._input_path is not None:
+            base_name = self._input_path.stem
             initial_filename = f"{base_name}_converted_{timestamp}.adi"
         else:
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
             initial_filename = f"cabrillo_converted_{timestamp}.adi"
             
         filename = filedialog.asksaveasfilename(
@@ -516,30 +676,51 @@ GitHub: github.com/ertig3 | 2025-09-02 19:37:45 UTC
         
         if filename:
             self.output_file.set(filename)
-            self.settings.set('last_output_dir', str(Path(filename).parent))
-            self.status_text.set(f"{_('save_adif')}: {Path(filename).name}")
+            parent, name = os.path.split(filename)
+            self.settings.set('last_output_dir', parent)
+            self._set_status(f"{_('save_adif')}: {name}")
             self.logger.info(f"Output file set: {filename}")
             
     def preview_file_info(self):
         """Preview Cabrillo file information"""
-        if not self.input_file.get() or not Path(self.input_file.get()).exists():
+        file_path = self._input_path
+        if file_path is None:
+            return
+        
+        # One stat call covers both the existence check and the size
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             return
             
         try:
-            file_path = Path(self.input_file.get())
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(2000)
+            # Only the head is shown: enough bytes for _PREVIEW_CHARS characters of UTF-8,
+            # decoded like the parser does (encoding fallback, universal newlines)
+            head_size = _PREVIEW_CHARS * 4
+            with open(file_path, 'rb', buffering=4096) as f:
+                head = f.read(head_size)
+            content = decode_cabrillo(head, final=len(head) < head_size)[0][:_PREVIEW_CHARS]
                 
-            qso_lines = [line for line in content.split('\n') if line.strip().startswith('QSO:')]
-            estimated_qsos = len(qso_lines)
-            
-            contest_lines = [line for line in content.split('\n') if line.strip().startswith('CONTEST:')]
-            contest_name = contest_lines[0].split(':', 1)[1].strip() if contest_lines else _('unknown')
+            # One pass over the head of the file for QSO count and the first CONTEST/CALLSIGN
+            estimated_qsos = 0
+            contest_name = callsign = None
+            for line in content.splitlines():
+                line = line.lstrip()
+                if not line.startswith(_PREVIEW_PREFIXES):
+                    continue
+                if line.startswith('QSO:'):
+                    estimated_qsos += 1
+                elif contest_name is None and line.startswith('CONTEST:'):
+                    contest_name = line[8:].strip()
+                elif callsign is None and line.startswith('CALLSIGN:'):
+                    callsign = line[9:].strip()
             
-            callsign_lines = [line for line in content.split('\n') if line.strip().startswith('CALLSIGN:')]
-            callsign = callsign_lines[0].split(':', 1)[1].strip() if callsign_lines else _('unknown')
+            if contest_name is None:
+                contest_name = _('unknown')
+            if callsign is None:
+                callsign = _('unknown')
             
             info_text = f"""FILE ANALYSIS - Cabrillo2ADIF Converter v0.9
 {'='*80}
@@ -549,7 +730,7 @@ Size: {file_size:,} bytes ({file_size/1024:.1f} KB)
 Estimated QSOs: {estimated_qsos}
 Contest: {contest_name}
 Station: {callsign}
-Analyzed: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+Analyzed: {_now_human()}
 GitHub: github.com/ertig3
 
 FILE CONTENT PREVIEW:
@@ -557,7 +738,7 @@ FILE CONTENT PREVIEW:
 {content}
 
 {'='*80}
-[Preview of first 2000 characters]
+[Preview of first {_PREVIEW_CHARS} characters]
 
 Ready for conversion!
 """
@@ -571,7 +752,7 @@ Ready for conversion!
 {'='*60}
 Error: {str(e)}
 File: {self.input_file.get()}
-Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+Time: {_now_human()}
 GitHub: github.com/ertig3
 
 Check file accessibility and format.
@@ -582,15 +763,18 @@ Check file accessibility and format.
             
     def start_conversion(self):
         """Start conversion process"""
-        if not self.input_file.get():
+        if self._busy("conversion start"):
+            return
+        
+        if self._input_path is None:
             messagebox.showerror(_('error_title'), _('error_no_input'))
             return
             
-        if not Path(self.input_file.get()).exists():
+        if not self._input_path.exists():
             messagebox.showerror(_('error_title'), _('error_file_not_found'))
             return
             
-        if not self.output_file.get():
+        if self._output_path is None:
             messagebox.showerror(_('error_title'), _('error_no_output'))
             return
         
@@ -600,152 +784,202 @@ Check file accessibility and format.
         """Perform file conversion"""
         self.progress.start(10)
         self.convert_button.config(state='disabled', text=_('converting_button'))
-        self.status_text.set(_('status_converting'))
-        self.status_display.config(text="Converting...", fg=self.theme.ACCENT_ORANGE)
-        self.root.update()
+        self._set_status(_('status_converting'), "Converting...", self.theme.ACCENT_ORANGE)
         
-        start_time = datetime.utcnow()
+        input_path = self._input_path
+        output_path = self._output_path
+        # Monotonic start for the duration; wall-clock times are only formatted for display
+        start_time = time.perf_counter()
         
-        try:
-            log_text = f"""{_('conversion_started')} - Cabrillo2ADIF Converter v0.9
+        log_text = f"""{_('conversion_started')} - Cabrillo2ADIF Converter v0.9
 {'='*80}
-Start: {start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}
-Input: {Path(self.input_file.get()).name}
-Output: {Path(self.output_file.get()).name}
+Start: {_now_human()}
+Input: {input_path.name}
+Output: {output_path.name}
 GitHub: github.com/ertig3
 
 """
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, log_text)
-            self.root.update()
-            
-            self.status_text.set(_('parsing_cabrillo'))
-            self.root.update()
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(1.0, log_text)
+        
+        # Parse/generate/write run on a worker thread; Tk is only touched from _drain_queue
+        self._conversion_thread = threading.Thread(
+            target=self._convert_worker,
+            args=(input_path, output_path, start_time)
+        )
+        self._conversion_thread.start()
+        self.root.after(100, self._drain_queue)
+        
+    def _convert_worker(self, input_path, output_path, start_time):
+        """Run the conversion off the Tk main thread, reporting through the UI queue"""
+        post = self._ui_queue.put
+        try:
+            post(('status', _('parsing_cabrillo')))
             
             parser = CabrilloParser()
-            qsos = parser.parse_file(self.input_file.get())
+            # The whole file is read here, on the worker thread, never on the Tk thread
+            qsos = parser.parse_file(input_path)
             contest_info = parser.get_contest_info()
             
-            log_text += f"[1/3] {len(qsos)} QSOs parsed successfully\n"
+            log_parts = [f"[1/3] {len(qsos)} QSOs parsed successfully\n"]
             if contest_info:
-                log_text += f"Contest: {contest_info.get('contest', _('unknown'))}\n"
-                log_text += f"Station: {contest_info.get('callsign', _('unknown'))}\n"
+                log_parts.append(f"Contest: {contest_info.get('contest', _('unknown'))}\n")
+                log_parts.append(f"Station: {contest_info.get('callsign', _('unknown'))}\n")
             
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, log_text)
-            self.root.update()
+            post(('append', ''.join(log_parts)))
             
             if len(qsos) == 0:
                 raise Exception(_('error_no_qsos'))
             
-            self.qso_count.set(f"{len(qsos)} QSOs")
-            
-            self.status_text.set(_('generating_adif'))
-            self.root.update()
+            post(('qso_count', f"{len(qsos)} QSOs"))
+            post(('status', _('generating_adif')))
             
             generator = ADIFGenerator()
             adif_content = generator.generate(qsos, contest_info)
             
             stats = generator.get_conversion_stats()
             
-            log_text += f"[2/3] ADIF 3.1.4 format generated ({len(adif_content)} characters)\n"
-            log_text += f"QSOs processed: {stats.get('total_qsos', len(qsos))}\n"
-            
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, log_text)
-            self.root.update()
-            
-            self.status_text.set(_('saving_file'))
-            self.root.update()
+            post(('append', f"[2/3] ADIF 3.1.4 format generated ({len(adif_content)} characters)\n"
+                            f"QSOs processed: {stats.get('total_qsos', len(qsos))}\n"))
+            post(('status', _('saving_file')))
             
-            output_path = Path(self.output_file.get())
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(adif_content)
+            # Encode once and hand the bytes over in a single write; keep text-mode line endings
+            data = adif_content.encode('utf-8')
+            if os.linesep != '\n':
+                data = data.replace(b'\n', os.linesep.encode('ascii'))
+            # Write a sibling temp file and swap it in so a failed save never leaves half a file
+            tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+            try:
+                with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                    f.write(data)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
             
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
-            log_text += f"[3/3] ADIF file saved: {output_path.name}\n\n"
-            log_text += f"{_('conversion_completed')}!\n"
-            log_text += f"{_('duration')}: {duration:.2f} {_('seconds')}\n"
-            log_text += f"Output size: {len(adif_content):,} characters\n"
-            log_text += f"GitHub: github.com/ertig3\n\n"
+            log_parts = [
+                f"[3/3] ADIF file saved: {output_path.name}\n\n",
+                f"{_('conversion_completed')}!\n",
+                f"{_('duration')}: {duration:.2f} {_('seconds')}\n",
+                f"Output size: {len(adif_content):,} characters\n",
+                "GitHub: github.com/ertig3\n\n",
+                f"{_('adif_preview')}:\n",
+                "="*80 + "\n",
+            ]
             
-            log_text += f"{_('adif_preview')}:\n"
-            log_text += "="*80 + "\n"
-            log_text += adif_content[:2000]
-            if len(adif_content) > 2000:
-                log_text += f"\n\n[...{len(adif_content)-2000} more characters...]\n"
-            log_text += "\n" + "="*80
-            
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, log_text)
-            
-            self.status_text.set(_('status_success'))
-            self.status_display.config(text="Success!", fg=self.theme.ACCENT_GREEN)
-            self.progress.stop()
-            self.convert_button.config(state='normal', text=_('convert_button'))
-            
-            messagebox.showinfo(_('success_title'), 
-                              f"{_('success_conversion')}\n\n"
-                              f"QSOs: {len(qsos)}\n"
-                              f"Duration: {duration:.2f}s\n"
-                              f"File: {output_path.name}")
-            
-            self.logger.info(f"Conversion completed - {len(qsos)} QSOs")
+            # Header, preview slice and trailer go in as separate inserts, not one joined string
+            post(('append', ''.join(log_parts)))
+            post(('append', adif_content[:2000]))
+            overflow = len(adif_content) - 2000
+            if overflow > 0:
+                post(('append', f"\n\n[...{overflow} more characters...]\n"))
+            post(('append', "\n" + "="*80))
+            post(('done', (len(qsos), duration, output_path.name)))
             
         except Exception as e:
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            error_text = f"""CONVERSION ERROR
+            post(('error', (e, start_time, input_path, output_path)))
+    
+    def _drain_queue(self):
+        """Apply worker updates on the Tk main thread until the conversion ends"""
+        finished = False
+        try:
+            while True:
+                kind, payload = self._ui_queue.get_nowait()
+                if kind == 'status':
+                    self._set_status(payload)
+                elif kind == 'append':
+                    self._append_preview(payload)
+                elif kind == 'qso_count':
+                    self.qso_count.set(payload)
+                elif kind == 'done':
+                    self._conversion_succeeded(*payload)
+                    finished = True
+                elif kind == 'error':
+                    self._conversion_failed(*payload)
+                    finished = True
+        except queue.Empty:
+            pass
+        
+        if not finished:
+            self.root.after(100, self._drain_queue)
+    
+    def _append_preview(self, chunk):
+        """Append text to the preview instead of re-rendering its whole content"""
+        self.preview_text.insert(tk.END, chunk)
+        self.preview_text.see(tk.END)
+    
+    def _conversion_succeeded(self, qso_count, duration, output_name):
+        """Finish a successful conversion on the Tk main thread"""
+        self._set_status(_('status_success'), "Success!", self.theme.ACCENT_GREEN)
+        self.progress.stop()
+        self.convert_button.config(state='normal', text=_('convert_button'))
+        
+        messagebox.showinfo(_('success_title'), 
+                          f"{_('success_conversion')}\n\n"
+                          f"QSOs: {qso_count}\n"
+                          f"Duration: {duration:.2f}s\n"
+                          f"File: {output_name}")
+        
+        self.logger.info(f"Conversion completed - {qso_count} QSOs")
+    
+    def _conversion_failed(self, e, start_time, input_path, output_path):
+        """Report a failed conversion on the Tk main thread"""
+        duration = time.perf_counter() - start_time
+        
+        error_text = f"""CONVERSION ERROR
 {'='*60}
 Error: {str(e)}
-Time: {end_time.strftime('%Y-%m-%d %H:%M:%S UTC')}
+Time: {_now_human()}
 Duration: {duration:.2f} seconds
 GitHub: github.com/ertig3
 
-Input File: {self.input_file.get()}
-Output File: {self.output_file.get()}
+Input File: {input_path}
+Output File: {output_path}
 
 Check file format and permissions.
 """
-            
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, error_text)
-            
-            self.status_text.set(_('status_error'))
-            self.status_display.config(text="Error!", fg=self.theme.ACCENT_RED)
-            self.progress.stop()
-            self.convert_button.config(state='normal', text=_('convert_button'))
-            
-            messagebox.showerror(_('error_title'), f"{_('error_conversion')}\n\n{str(e)}")
-            self.logger.error(f"Conversion failed: {e}")
+        
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(1.0, error_text)
+        
+        self._set_status(_('status_error'), "Error!", self.theme.ACCENT_RED)
+        self.progress.stop()
+        self.convert_button.config(state='normal', text=_('convert_button'))
+        
+        messagebox.showerror(_('error_title'), f"{_('error_conversion')}\n\n{str(e)}")
+        self.logger.error(f"Conversion failed: {e}")
     
     def clear_preview(self):
         """Clear preview area"""
+        if self._busy("clear"):
+            return
+        
         self.show_welcome_text()
-        self.status_text.set(_('status_cleared'))
-        self.status_display.config(text=_('status_ready'), fg=self.theme.ACCENT_GREEN)
+        self._set_status(_('status_cleared'), _('status_ready'), self.theme.ACCENT_GREEN)
         self.qso_count.set("0 QSOs")
         self.logger.info("Preview cleared")
     
     def reset_all(self):
         """Reset all input fields"""
+        if self._busy("reset"):
+            return
+        
         self.input_file.set("")
         self.output_file.set("")
         self.show_welcome_text()
-        self.status_text.set(_('status_reset'))
-        self.status_display.config(text=_('status_ready'), fg=self.theme.ACCENT_GREEN)
+        self._set_status(_('status_reset'), _('status_ready'), self.theme.ACCENT_GREEN)
         self.qso_count.set("0 QSOs")
         self.logger.info("All fields reset")
     
     def save_preview(self):
         """Save preview content to file"""
         try:
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+            timestamp = _now_token()
             default_filename = f"conversion_log_{timestamp}.txt"
             
             filename = filedialog.asksaveasfilename(
@@ -756,10 +990,14 @@ Check file format and permissions.
                 initialfile=default_filename
             )
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.preview_text.get(1.0, tk.END))
+                # Copy the widget out in line ranges rather than as one big string
+                preview = self.preview_text
+                last_line = int(preview.index('end-1c').split('.')[0])
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    for line in range(1, last_line + 1, _SAVE_CHUNK_LINES):
+                        f.write(preview.get(f"{line}.0", f"{line + _SAVE_CHUNK_LINES}.0"))
                 
-                self.status_text.set(_('success_saved'))
+                self._set_status(_('success_saved'))
                 messagebox.showinfo(_('success_title'), f"{_('success_saved')}")
                 self.logger.info(f"Preview saved: {filename}")
         except Exception as e:
@@ -769,12 +1007,13 @@ Check file format and permissions.
     def copy_preview(self):
         """Copy preview content to clipboard"""
         try:
+            text = self.preview_text.get(1.0, tk.END)
             self.root.clipboard_clear()
-            self.root.clipboard_append(self.preview_text.get(1.0, tk.END))
-            self.root.update()
+            self.root.clipboard_append(text)
+            self.root.update_idletasks()
             
-            self.status_text.set(_('success_copied'))
-            messagebox.showinfo(_('success_title'), f"{_('success_copied')}")
+            # Report in the status bar; a modal dialog here would spin its own event loop
+            self._set_status(_('success_copied'))
             self.logger.info("Preview copied to clipboard")
         except Exception as e:
             messagebox.showerror(_('error_title'), f"Error copying to clipboard: {e}")
@@ -784,15 +1023,19 @@ Check file format and permissions.
         """Open output directory"""
         try:
             output_dir = self.default_output_dir
-            if self.output_file.get():
-                output_dir = Path(self.output_file.get()).parent
+            if self._output_path is not None:
+                output_dir = self._output_path.parent
             
+            # Launch without a shell and without waiting; Explorer start-up runs off the Tk thread
             if sys.platform == "win32":
-                os.startfile(output_dir)
-            elif sys.platform == "darwin":
-                os.system(f"open '{output_dir}'")
+                threading.Thread(target=_start_file, args=(output_dir,), daemon=True).start()
             else:
-                os.system(f"xdg-open '{output_dir}'")
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen([opener, str(output_dir)],
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 close_fds=True)
                 
             self.logger.info(f"Output folder opened: {output_dir}")
         except Exception as e:
@@ -801,8 +1044,14 @@ Check file format and permissions.
     
     def change_language(self, language_code):
         """Change application language"""
+        if self._busy("language change"):
+            return
+        
         self.settings.set('language', language_code)
         translator.set_language(language_code)
+        self._welcome_cache = None
+        self._about_cache.clear()
+        self._help_cache.clear()
         
         self.root.title(_('app_title') + " " + _('version'))
         
@@ -817,75 +1066,61 @@ Check file format and permissions.
     
     def show_about(self):
         """Show about dialog"""
-        about_text = f"""{_('about_title')}
-
-{_('about_version')} - Modern Edition
-{_('about_created')}
-{_('about_purpose')}
-
-GitHub: github.com/ertig3
-Date: 2025-09-02 19:37:45 UTC
-
-FEATURES:
-- ADIF 3.1.4 output
-- Multi-language support
-- Modern dark theme
-- Real-time preview
-- Error handling
-
-SUPPORTED FORMATS:
-- Input: Cabrillo (.cbr, .log, .txt)
-- Output: ADIF 3.1.4 (.adi)
-
-SUPPORTED BANDS:
-- HF: 160M-10M
-- VHF/UHF: 6M-3CM
-- LF: 2200M-630M
-
-For amateur radio community
-"""
+        lang = translator.current_language
+        about_text = self._about_cache.get(lang)
+        if about_text is None:
+            about_text = self._about_cache[lang] = self._build_about_text()
         messagebox.showinfo(_('about_title'), about_text)
     
-    def show_help(self):
+    def _build_about_text(self):
+        """Format the about dialog body for the current language"""
+        return "\n".join((
+            _('about_title'),
+            "",
+            f"{_('about_version')} - Modern Edition",
+            _('about_created'),
+            _('about_purpose'),
+            *self._ABOUT_STATIC,
+        ))
+    
+    def show_help(self, event=None):
         """Show help dialog"""
-        help_text = f"""{_('help_title')}
-
-{_('help_quickstart')}
-1. Select Cabrillo file
-2. Choose ADIF output location
-3. Click START CONVERSION
-4. Review results
-
-{_('help_formats')}
-- Cabrillo: .cbr, .log, .txt
-- ADIF: .adi (version 3.1.4)
-
-{_('help_features')}
-- File selection
-- Live preview
-- Multi-language
-- Dark theme
-- Error handling
-
-TROUBLESHOOTING:
-- Check file format
-- Verify permissions
-- Use test file
-- Check error messages
-- Ensure disk space
-
-GitHub: github.com/ertig3 | {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
-"""
-        messagebox.showinfo(_('help_title'), help_text)
+        lang = translator.current_language
+        help_text = self._help_cache.get(lang)
+        if help_text is None:
+            help_text = self._help_cache[lang] = self._build_help_text()
+        # Only the timestamp footer changes between opens
+        messagebox.showinfo(_('help_title'), f"{help_text}{_now_human()}\n")
+    
+    def _build_help_text(self):
+        """Format the help dialog body (without its timestamp) for the current language"""
+        return "\n".join((
+            _('help_title'),
+            "",
+            _('help_quickstart'),
+            *self._HELP_QUICKSTART,
+            _('help_formats'),
+            *self._HELP_FORMATS,
+            _('help_features'),
+            *self._HELP_FEATURES,
+        ))
     
     def run(self):
         """Start the application"""
         self.logger.info("Starting Cabrillo2ADIF GUI v0.9")
         self.root.mainloop()
         
+        # Let a running conversion finish writing its output file before exit
+        if self._conversion_running():
+            self.logger.info("Waiting for the running conversion to finish")
+            self._conversion_thread.join()
+        
         try:
             geometry = self.root.geometry()
             self.settings.set('window_geometry', geometry)
             self.logger.info(f"Window geometry saved: {geometry}")
         except:
-            pass
\ No newline at end of file
+            pass
+        
+        # Write the geometry and any still-pending changes before exit
+        self.settings.flush()
\ No newline at end of file
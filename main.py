@@ -10,6 +10,8 @@ User: ertig3
 import sys
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 
@@ -17,6 +19,30 @@ from settings import SettingsManager
 from translations import translator
 from gui import Cabrillo2ADIFConverterGUI
 
+# Write buffer for converter.log; flushed on ERROR records, flush() and close
+_LOG_BUFFER_SIZE = 64 * 1024
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches records in a block buffer instead of flushing each one"""
+    
+    def _open(self):
+        # FileHandler.errors only exists from Python 3.9
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=getattr(self, 'errors', None), buffering=_LOG_BUFFER_SIZE)
+    
+    def emit(self, record):
+        # StreamHandler.emit without its per-record flush(); flush() itself is unchanged
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 def setup_logging():
     """Configure application logging"""
     if getattr(sys, 'frozen', False):
@@ -26,20 +52,28 @@ def setup_logging():
     
     log_file = app_path / 'converter.log'
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        _BufferedFileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
     
-    return logging.getLogger(__name__)
+    # Callers only enqueue records; the listener thread does the file/console I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    
+    return logging.getLogger(__name__), listener
 
 def main():
     """Main application entry point"""
-    logger = setup_logging()
+    logger, listener = setup_logging()
     
     try:
         logger.info("Cabrillo2ADIF Converter v0.9 starting")
@@ -63,6 +97,10 @@ def main():
         print(f"Error: {e}")
         input("Press Enter to exit...")
         sys.exit(1)
+        
+    finally:
+        # Drain queued records to the handlers before the process exits
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,11 +6,24 @@ Date: 2025-09-02 19:31:37
 User: ertig3
 """
 
+import contextlib
+import copy
 import json
 import os
 import logging
+import stat
+import threading
 from pathlib import Path
 
+# Delay in seconds before a burst of set() calls is written out in one save
+_SAVE_DELAY = 0.5
+
+# {settings file path: (st_mtime_ns, parsed settings)} shared by SettingsManager instances
+_SETTINGS_CACHE = {}
+
+# Marks a key that is not in the settings yet, so a stored None still counts as a value
+_MISSING = object()
+
 class SettingsManager:
     """Application settings manager"""
     
@@ -33,16 +46,32 @@ class SettingsManager:
         
         self.settings = self.default_settings.copy()
         
+        # Pending-write state for the debounced save, see set() and flush()
+        # Reentrant: flush() holds it while calling save_settings(), which takes it too
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer = None
+        
         self.settings_dir.mkdir(exist_ok=True)
         self.load_settings()
     
     def load_settings(self):
         """Load settings from file"""
         try:
-            if self.settings_file.exists():
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    self.settings.update(loaded_settings)
+            try:
+                mtime_ns = self.settings_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            
+            if mtime_ns is not None:
+                cached = _SETTINGS_CACHE.get(self.settings_file)
+                if cached is not None and cached[0] == mtime_ns:
+                    loaded_settings = copy.deepcopy(cached[1])
+                else:
+                    with open(self.settings_file, 'r', encoding='utf-8') as f:
+                        loaded_settings = json.load(f)
+                    _SETTINGS_CACHE[self.settings_file] = (mtime_ns, copy.deepcopy(loaded_settings))
+                self.settings.update(loaded_settings)
                 self.logger.info("Settings loaded")
             else:
                 self.logger.info("Using default settings")
@@ -53,8 +82,26 @@ class SettingsManager:
     def save_settings(self):
         """Save settings to file"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            # Snapshot under the lock so set() on another thread can't change it mid-dump
+            with self._lock:
+                snapshot = dict(self.settings)
+            
+            # Write a sibling temp file and swap it in so a crash never leaves half a file
+            tmp_file = self.settings_file.with_suffix('.json.tmp')
+            data = json.dumps(snapshot, separators=(',', ':'), ensure_ascii=False)
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                # Keep the permissions of the file being replaced
+                with contextlib.suppress(FileNotFoundError):
+                    os.chmod(tmp_file, stat.S_IMODE(self.settings_file.stat().st_mode))
+                os.replace(tmp_file, self.settings_file)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_file)
+                raise
+            _SETTINGS_CACHE[self.settings_file] = (self.settings_file.stat().st_mtime_ns,
+                                                   copy.deepcopy(snapshot))
             self.logger.info("Settings saved")
         except Exception as e:
             self.logger.error(f"Settings save error: {e}")
@@ -64,9 +111,28 @@ class SettingsManager:
         return self.settings.get(key, default)
     
     def set(self, key, value):
-        """Set setting value"""
-        self.settings[key] = value
-        self.save_settings()
+        """Set setting value; the file is written shortly after, or on flush()"""
+        with self._lock:
+            if self.settings.get(key, _MISSING) == value:
+                return
+            self.settings[key] = value
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(_SAVE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending setting changes to file now"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save_settings()
     
     def is_first_run(self):
         """Check if first run"""
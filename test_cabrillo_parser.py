@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the Cabrillo parser
+Date: 2026-10-14
+User: ertig3
+"""
+
+import os
+import tempfile
+import unittest
+
+from cabrillo_parser import CabrilloParser
+
+# Two-QSO log, joined with the line ending under test
+_LOG_LINES = (
+    "START-OF-LOG: 3.0",
+    "CONTEST: CQ-WW-SSB",
+    "CALLSIGN: DL1ABC",
+    "QSO: 14250 PH 2025-10-25 0001 DL1ABC 59 14 W1AW 59 05 0",
+    "QSO: 7100 PH 2025-10-25 0002 DL1ABC 59 14 K1ABC 59 05 0",
+    "END-OF-LOG:",
+)
+
+class LineEndingTest(unittest.TestCase):
+    """Logs parse the same whatever their line endings"""
+
+    def _parse(self, newline):
+        data = newline.join(_LOG_LINES).encode('ascii')
+        fd, path = tempfile.mkstemp(suffix='.cbr')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            parser = CabrilloParser()
+            return parser, parser.parse_file(path)
+        finally:
+            os.unlink(path)
+
+    def test_line_endings(self):
+        for newline in ('\n', '\r\n', '\r'):
+            with self.subTest(newline=repr(newline)):
+                parser, qsos = self._parse(newline)
+                self.assertEqual([qso.dx_call for qso in qsos], ['W1AW', 'K1ABC'])
+                self.assertEqual(parser.get_contest_info().get('callsign'), 'DL1ABC')
+
+    def test_cr_only_bytes(self):
+        parser = CabrilloParser()
+        qsos = parser.parse_bytes('\r'.join(_LOG_LINES).encode('ascii'))
+        self.assertEqual(len(qsos), 2)
+        self.assertEqual(qsos[1].frequency, '7100')
+
+if __name__ == '__main__':
+    unittest.main()